@@ -0,0 +1,152 @@
+import os
+from itertools import islice
+
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def unique_columns(header):
+    """
+    Returns column names for the header that are safe to write out:
+    blank names become col_<index> and repeated names get a .1, .2, ... suffix.
+    """
+    columns = []
+    seen = set()
+    for i, name in enumerate(header):
+        name = str(name).strip() or f"col_{i}"
+        candidate = name
+        suffix = 1
+        while candidate in seen:
+            candidate = f"{name}.{suffix}"
+            suffix += 1
+        seen.add(candidate)
+        columns.append(candidate)
+    return columns
+
+
+def frame_rows(header, rows):
+    """
+    Builds a DataFrame from a list of rows, matching every row to the header length.
+    Rows with extra columns are trimmed and shorter rows are padded with empty strings.
+    Rows that repeat the header (e.g. on every page or chunk) are dropped.
+    Column names are made unique with unique_columns.
+    """
+    header = list(header)
+    num_cols = len(header)
+    if num_cols == 0:
+        raise ValueError("Cannot build a table without header columns.")
+    columns = unique_columns(header)
+    # dtype=object keeps every cell as given (no numeric inference, so 1 stays "1")
+    df = pd.DataFrame(rows, dtype=object)
+    if df.empty:
+        return pd.DataFrame(columns=columns, dtype=object)
+
+    # Pad/trim all rows at once: missing cells come back as None from the constructor
+    df = df.reindex(columns=range(num_cols)).fillna("").astype(str)
+
+    # Drop repeated header rows by comparing every row against the header in one pass
+    header_values = pd.Series(header, dtype=object).astype(str).to_numpy()
+    is_header = (df.to_numpy() == header_values).all(axis=1)
+    df = df.loc[~is_header].reset_index(drop=True)
+    df.columns = columns
+    return df
+
+
+def iter_row_chunks(rows, header, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams rows (e.g. the concatenated parse_extracted_text output of many pages)
+    as DataFrames of at most chunk_size rows each, skipping chunks left empty
+    once repeated headers are dropped.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        df = frame_rows(header, chunk)
+        if not df.empty:
+            yield df
+
+
+def _split_header(rows, header):
+    """
+    Returns (header, rows), taking the first row as the header if none is given.
+    The header is None if it was not given and rows is empty.
+    """
+    rows = iter(rows)
+    if header is None:
+        header = next(rows, None)
+    return (list(header) if header is not None else None), rows
+
+
+def write_csv_frames(frames, path, columns):
+    """
+    Writes DataFrame chunks (e.g. from iter_row_chunks or frame_rows) to a single CSV,
+    with the given column names written once as the header. path may be a file path
+    or a text buffer; an existing file is overwritten. Writing to a file path keeps
+    only one chunk in memory at a time. Returns the number of data rows written.
+    """
+    if not columns:
+        # No header: leave an empty file (pandas would write a blank line)
+        if isinstance(path, (str, os.PathLike)):
+            open(path, "w").close()
+        return 0
+
+    pd.DataFrame(columns=columns).to_csv(path, index=False)
+    written = 0
+    for df in frames:
+        df.to_csv(path, mode="a", header=False, index=False)
+        written += len(df)
+    return written
+
+
+def write_parquet_frames(frames, path, columns):
+    """
+    Writes DataFrame chunks to a single Parquet file, one row group per chunk, with
+    every column stored as strings. path may be a file path or a binary buffer.
+    With no columns an empty file with an empty schema is written.
+    Requires pyarrow. Returns the number of data rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet export requires pyarrow. Install it with 'pip install pyarrow'.") from exc
+
+    schema = pa.schema([(name, pa.string()) for name in columns])
+    written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for df in frames:
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+            written += len(df)
+    return written
+
+
+def write_csv(rows, path, header=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams rows to a single CSV file in chunks of chunk_size rows (see write_csv_frames).
+    If no header is given, the first row is used as the header; only the header is
+    written when there are no data rows, and an empty file when there is no header.
+    Returns the number of data rows written.
+    """
+    table_header, rows = _split_header(rows, header)
+    if table_header is None:
+        return write_csv_frames([], path, [])
+    frames = iter_row_chunks(rows, table_header, chunk_size=chunk_size)
+    return write_csv_frames(frames, path, unique_columns(table_header))
+
+
+def write_parquet(rows, path, header=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams rows to a single Parquet file in chunks of chunk_size rows
+    (see write_parquet_frames). If no header is given, the first row is used as
+    the header; with no header an empty file with no columns is written.
+    Returns the number of data rows written.
+    """
+    table_header, rows = _split_header(rows, header)
+    if table_header is None:
+        return write_parquet_frames([], path, [])
+    frames = iter_row_chunks(rows, table_header, chunk_size=chunk_size)
+    return write_parquet_frames(frames, path, unique_columns(table_header))
@@ -0,0 +1,211 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+
+# Batches of new or removed keys up to this size are applied to a sorted key list
+# one at a time with bisect; larger batches are spliced into a new list in one pass.
+_BISECT_BATCH_LIMIT = 64
+
+
+def normalize_content(content):
+    """
+    Normalises cell content (or a column header) for indexing and lookups:
+    casefolds the text and collapses runs of whitespace into single spaces.
+    """
+    if content is None:
+        return ""
+    return " ".join(str(content).split()).casefold()
+
+
+def _merge_keys(keys, new_keys):
+    """
+    Merges new_keys (not already present) into the sorted list keys and
+    returns the resulting sorted list.
+    """
+    if len(new_keys) <= _BISECT_BATCH_LIMIT:
+        for key in new_keys:
+            insort(keys, key)
+        return keys
+    merged = []
+    start = 0
+    for key in sorted(new_keys):
+        end = bisect_left(keys, key, start)
+        merged.extend(keys[start:end])
+        merged.append(key)
+        start = end
+    merged.extend(keys[start:])
+    return merged
+
+
+def _remove_keys(keys, removed_keys):
+    """
+    Removes removed_keys (all present) from the sorted list keys and
+    returns the resulting sorted list.
+    """
+    if len(removed_keys) <= _BISECT_BATCH_LIMIT:
+        for key in removed_keys:
+            del keys[bisect_left(keys, key)]
+        return keys
+    kept = []
+    start = 0
+    for key in sorted(removed_keys):
+        end = bisect_left(keys, key, start)
+        kept.extend(keys[start:end])
+        start = end + 1
+    kept.extend(keys[start:])
+    return kept
+
+
+def _prefix_range(keys, prefix):
+    """
+    Yields the keys of the sorted list keys that start with prefix.
+    """
+    for i in range(bisect_left(keys, prefix), len(keys)):
+        key = keys[i]
+        if not key.startswith(prefix):
+            break
+        yield key
+
+
+class TableIndex:
+    """
+    Inverted index over the TABLECELL entries produced by build_json_structure.
+    Maps normalised cell content, optionally scoped to a column header, to the
+    (file_id, tabledata_id, row_index) locations where it occurs.
+    Row 0 of each table is treated as the header row, as in main.py, and rows
+    repeating it are not indexed. row_index is the TABLECELL row index.
+    """
+
+    def __init__(self):
+        # content -> set of (file_id, tabledata_id, row_index)
+        self._postings = defaultdict(set)
+        # column -> content -> set of (file_id, tabledata_id, row_index)
+        self._column_postings = defaultdict(lambda: defaultdict(set))
+        # file_id -> list of (column, content, location) added for that file
+        self._file_entries = defaultdict(list)
+        # Sorted content keys for prefix lookups, overall and per column
+        self._sorted_keys = []
+        self._column_keys = defaultdict(list)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._file_entries.values())
+
+    def add_document(self, json_output):
+        """
+        Adds (or replaces) the cells of one build_json_structure output.
+        Re-adding a file with the same FILE id drops its previous entries first,
+        so a file can be re-processed without duplicating postings.
+        """
+        file_id = json_output["FILE"]["id"]
+        self.remove_file(file_id)
+
+        tabledata_id = json_output["TABLEDATA"]["id"]
+        cells = json_output["TABLECELL"]
+
+        rows = defaultdict(dict)
+        for cell in cells:
+            rows[cell["row_index"]][cell["col_index"]] = normalize_content(cell["content"])
+        headers = rows.get(0, {})
+
+        # Each extracted chunk repeats the header, so skip every row that matches it
+        # (missing cells count as empty, extra cells are ignored, as in export.frame_rows)
+        header_rows = {
+            row_index for row_index, row in rows.items()
+            if row_index == 0 or headers and all(row.get(col_index, "") == header for col_index, header in headers.items())
+        }
+
+        new_keys = set()
+        new_column_keys = defaultdict(set)
+        entries = self._file_entries[file_id]
+        for cell in cells:
+            row_index = cell["row_index"]
+            if row_index in header_rows:
+                continue
+            content = rows[row_index][cell["col_index"]]
+            if not content:
+                continue
+            column = headers.get(cell["col_index"], "")
+            location = (file_id, cell.get("tabledata_id", tabledata_id), row_index)
+            if content not in self._postings:
+                new_keys.add(content)
+            column_postings = self._column_postings[column]
+            if content not in column_postings:
+                new_column_keys[column].add(content)
+            self._postings[content].add(location)
+            column_postings[content].add(location)
+            entries.append((column, content, location))
+
+        self._sorted_keys = _merge_keys(self._sorted_keys, new_keys)
+        for column, keys in new_column_keys.items():
+            self._column_keys[column] = _merge_keys(self._column_keys[column], keys)
+
+    def remove_file(self, file_id):
+        """
+        Removes every posting that was added for the given FILE id.
+        """
+        entries = self._file_entries.pop(file_id, [])
+        removed_keys = set()
+        removed_column_keys = defaultdict(set)
+        for column, content, location in entries:
+            postings = self._postings.get(content)
+            if postings is not None:
+                postings.discard(location)
+                if not postings:
+                    del self._postings[content]
+                    removed_keys.add(content)
+            column_postings = self._column_postings[column]
+            postings = column_postings.get(content)
+            if postings is not None:
+                postings.discard(location)
+                if not postings:
+                    del column_postings[content]
+                    removed_column_keys[column].add(content)
+
+        self._sorted_keys = _remove_keys(self._sorted_keys, removed_keys)
+        for column, keys in removed_column_keys.items():
+            self._column_keys[column] = _remove_keys(self._column_keys[column], keys)
+            if not self._column_keys[column]:
+                del self._column_keys[column]
+                del self._column_postings[column]
+
+    def lookup(self, content, column=None):
+        """
+        Returns the sorted (file_id, tabledata_id, row_index) locations whose cell
+        exactly matches content. If column is given, only cells under that
+        column header are considered.
+        """
+        content = normalize_content(content)
+        if column is None:
+            postings = self._postings.get(content, ())
+        else:
+            column_postings = self._column_postings.get(normalize_content(column), {})
+            postings = column_postings.get(content, ())
+        return sorted(postings)
+
+    def prefix_lookup(self, prefix, column=None):
+        """
+        Returns the sorted locations whose cell content starts with prefix,
+        optionally restricted to a single column header.
+        """
+        prefix = normalize_content(prefix)
+        if column is None:
+            keys = self._sorted_keys
+            postings = self._postings
+        else:
+            column = normalize_content(column)
+            keys = self._column_keys.get(column, [])
+            postings = self._column_postings.get(column, {})
+        locations = set()
+        for key in _prefix_range(keys, prefix):
+            locations.update(postings[key])
+        return sorted(locations)
+
+
+def build_index(json_outputs):
+    """
+    Builds a TableIndex from an iterable of build_json_structure outputs.
+    """
+    index = TableIndex()
+    for json_output in json_outputs:
+        index.add_document(json_output)
+    return index
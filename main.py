@@ -7,9 +7,12 @@ from datetime import datetime
 from PIL import Image
 import fitz  # PyMuPDF for PDF conversion
 import math
+import hashlib
 from google import genai
 from google.genai import types
 from conversion import parse_extracted_text, build_json_structure
+from indexing import TableIndex
+from export import frame_rows, write_csv_frames, write_parquet_frames
 
 def pdf_to_images(pdf_bytes, password=None):
     """
@@ -32,24 +35,48 @@ def pdf_to_images(pdf_bytes, password=None):
         images.append(image)
     return images
 
-def adjust_table_rows(header, rows):
+def file_id_for(pdf_bytes):
     """
-    Adjust each row so that it matches the header length.
-    If a row has extra columns, trim them; if it has fewer, pad with empty strings.
+    Derive a stable FILE id from the PDF contents, so each distinct upload gets its own
+    entry in the index and re-uploading the same PDF replaces its previous entry.
     """
-    adjusted_rows = []
-    num_cols = len(header)
-    for row in rows:
-        if len(row) > num_cols:
-            row = row[:num_cols]
-        elif len(row) < num_cols:
-            row = row + [""] * (num_cols - len(row))
-        adjusted_rows.append(row)
-    return adjusted_rows
+    return int(hashlib.sha1(pdf_bytes).hexdigest()[:12], 16)
 
-def main():
-    st.title("Upload PDF and Process Data")
-    
+def search_index():
+    """
+    Search box over the cells indexed from the PDFs processed in this session.
+    """
+    table_index = st.session_state.get("table_index")
+    if table_index is None or len(table_index) == 0:
+        return
+
+    st.subheader("Search Extracted Data")
+    query = st.text_input("Search value")
+    column = st.text_input("Column (optional)")
+    match_prefix = st.checkbox("Match prefix")
+    if not query:
+        return
+
+    if match_prefix:
+        locations = table_index.prefix_lookup(query, column=column or None)
+    else:
+        locations = table_index.lookup(query, column=column or None)
+
+    if locations:
+        file_names = st.session_state.indexed_files
+        st.dataframe(pd.DataFrame(
+            [(file_names.get(file_id, file_id), row_index) for file_id, _, row_index in locations],
+            columns=["File", "Source row"]
+        ))
+        st.caption("Source row is the row's position in the extracted text, where 0 is the header "
+                   "and repeated header rows are still counted.")
+    else:
+        st.info("No matching cells found.")
+
+def process_pdf():
+    """
+    Upload a PDF, extract its tables with Gemini and add the result to the session index.
+    """
     # Upload PDF file
     uploaded_file = st.file_uploader("Choose a PDF file", type=["pdf"])
     
@@ -127,13 +154,13 @@ def main():
             
             # Define project and file information
             project_id = 101
-            file_id = 102
+            file_id = file_id_for(pdf_bytes)
             metadata_id = 103
             tabledata_id = 104
             project_name = "MyProject"
             project_description = "Extracted from PDF images"
-            file_name = "extracted_data.txt"
-            file_format = "txt"
+            file_name = uploaded_file.name
+            file_format = "pdf"
             scanned_file_name = "extracted_data_scanned.txt"
             
             # Build the JSON structure using your custom function
@@ -152,17 +179,54 @@ def main():
             
             json_str = json.dumps(json_output, indent=2)
             
+            # Add the extracted cells to the session's index so they can be searched across files
+            if "table_index" not in st.session_state:
+                st.session_state.table_index = TableIndex()
+                st.session_state.indexed_files = {}
+            st.session_state.table_index.add_document(json_output)
+            st.session_state.indexed_files[file_id] = file_name
+            
             # Construct the DataFrame directly from table_rows.
             if table_rows:
                 header = table_rows[0]
-                data_rows = adjust_table_rows(header, table_rows[1:])
-                df = pd.DataFrame(data_rows, columns=header)
+                df = frame_rows(header, table_rows[1:])
                 st.subheader("Extracted Table Data")
                 st.dataframe(df)
+                
+                # Downloads reuse the displayed frame (repeated headers already dropped, rows
+                # padded/trimmed) and are built in memory, since st.download_button needs the
+                # whole file; use export.write_csv/write_parquet with a file path to stream
+                columns = list(df.columns)
+                csv_buffer = io.StringIO()
+                write_csv_frames([df], csv_buffer, columns)
+                st.download_button(
+                    "Download CSV",
+                    data=csv_buffer.getvalue(),
+                    file_name="extracted_data.csv",
+                    mime="text/csv"
+                )
+                try:
+                    parquet_buffer = io.BytesIO()
+                    write_parquet_frames([df], parquet_buffer, columns)
+                    st.download_button(
+                        "Download Parquet",
+                        data=parquet_buffer.getvalue(),
+                        file_name="extracted_data.parquet",
+                        mime="application/octet-stream"
+                    )
+                except ImportError as e:
+                    st.info(str(e))
             else:
                 st.error("No table rows extracted.")
     else:
         st.info("Please upload a PDF file.")
 
+def main():
+    st.title("Upload PDF and Process Data")
+    
+    process_pdf()
+    # Rendered after processing so a newly indexed PDF is searchable right away
+    search_index()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from export import frame_rows, iter_row_chunks, unique_columns, write_csv, write_parquet
+
+
+def test_frame_rows_pads_and_trims_ragged_rows():
+    df = frame_rows(["a", "b", "c"], [["1"], ["2", "3", "4", "5"], ["6", "7", "8"]])
+    assert df.columns.tolist() == ["a", "b", "c"]
+    assert df.values.tolist() == [["1", "", ""], ["2", "3", "4"], ["6", "7", "8"]]
+
+
+def test_frame_rows_drops_repeated_headers():
+    df = frame_rows(["a", "b"], [["a", "b"], ["1", "2"], ["a", "b"], ["3", "4"]])
+    assert df.values.tolist() == [["1", "2"], ["3", "4"]]
+
+
+def test_frame_rows_rejects_empty_header():
+    with pytest.raises(ValueError):
+        frame_rows([], [["1", "2"]])
+
+
+def test_unique_columns():
+    assert unique_columns(["", "a", "b", "a", ""]) == ["col_0", "a", "b", "a.1", "col_4"]
+
+
+def test_repeated_headers_dropped_across_chunk_boundaries():
+    rows = [["1", "2"], ["a", "b"], ["a", "b"], ["3", "4"], ["a", "b"]]
+    chunks = list(iter_row_chunks(rows, ["a", "b"], chunk_size=2))
+    assert [chunk.values.tolist() for chunk in chunks] == [[["1", "2"]], [["3", "4"]]]
+
+
+def test_csv_round_trip(tmp_path):
+    path = tmp_path / "out.csv"
+    rows = [["Login", "Name"], ["omar1993", "Omar"], ["Login", "Name"], ["anna"], ["zoe", "Zoe", "extra"]]
+    assert write_csv(rows, path, chunk_size=2) == 3
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    assert df.columns.tolist() == ["Login", "Name"]
+    assert df.values.tolist() == [["omar1993", "Omar"], ["anna", ""], ["zoe", "Zoe"]]
+
+
+def test_csv_header_only_overwrites_existing_file(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_text("stale\n")
+    assert write_csv([["h1", "h2"], ["h1", "h2"]], path) == 0
+    assert path.read_text() == "h1,h2\n"
+
+
+def test_parquet_round_trip_with_blank_and_repeated_names(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "out.parquet"
+    rows = [
+        ["", "a", "a", ""],
+        ["", "1", "2", ""],
+        ["", "a", "a", ""],
+        ["", "3", "4", "", "x"],
+        ["", "5"],
+    ]
+    assert write_parquet(rows, path, chunk_size=2) == 3
+    df = pd.read_parquet(path)
+    assert df.columns.tolist() == ["col_0", "a", "a.1", "col_3"]
+    assert df.values.tolist() == [["", "1", "2", ""], ["", "3", "4", ""], ["", "5", "", ""]]
+
+
+def test_frame_rows_keeps_cells_as_given():
+    df = frame_rows(["a", "b"], [[None, 1], [1.5]])
+    assert df.values.tolist() == [["", "1"], ["1.5", ""]]
+
+
+def test_empty_input_writes_empty_files(tmp_path):
+    csv_path = tmp_path / "out.csv"
+    csv_path.write_text("stale\n")
+    assert write_csv([], csv_path) == 0
+    assert csv_path.read_text() == ""
+
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "out.parquet"
+    assert write_parquet([], parquet_path) == 0
+    assert pd.read_parquet(parquet_path).shape == (0, 0)
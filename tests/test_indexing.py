@@ -0,0 +1,108 @@
+from indexing import TableIndex, build_index
+
+
+def make_document(file_id, rows, tabledata_id=1):
+    cells = []
+    for r_idx, row in enumerate(rows):
+        for c_idx, content in enumerate(row):
+            cells.append({
+                "id": len(cells) + 1,
+                "row_index": r_idx,
+                "col_index": c_idx,
+                "col_span": 1,
+                "row_span": 1,
+                "content": content,
+                "tabledata_id": tabledata_id
+            })
+    return {
+        "FILE": {"id": file_id},
+        "TABLEDATA": {"id": tabledata_id},
+        "TABLECELL": cells
+    }
+
+
+ROWS = [
+    ["Login", "Firstname"],
+    ["omar1993", "Omar"],
+    ["omar77", "  OMAR  Said "],
+    ["anna", "Anna"],
+]
+
+
+def test_exact_lookup_is_normalised():
+    index = build_index([make_document(1, ROWS)])
+    assert index.lookup("OMAR1993") == [(1, 1, 1)]
+    assert index.lookup("omar said") == [(1, 1, 2)]
+    assert index.lookup("missing") == []
+
+
+def test_header_row_is_not_indexed():
+    index = build_index([make_document(1, ROWS)])
+    assert index.lookup("login") == []
+
+
+def test_column_lookup():
+    index = build_index([make_document(1, ROWS)])
+    assert index.lookup("omar", column="Firstname") == [(1, 1, 1)]
+    assert index.lookup("omar", column="Login") == []
+    assert index.lookup("omar", column="Unknown") == []
+
+
+def test_prefix_lookup():
+    index = build_index([make_document(1, ROWS), make_document(2, ROWS, tabledata_id=7)])
+    assert index.prefix_lookup("omar") == [(1, 1, 1), (1, 1, 2), (2, 7, 1), (2, 7, 2)]
+    assert index.prefix_lookup("an") == [(1, 1, 3), (2, 7, 3)]
+    assert index.prefix_lookup("zz") == []
+
+
+def test_column_prefix_lookup():
+    index = build_index([make_document(1, ROWS)])
+    assert index.prefix_lookup("omar", column="Login") == [(1, 1, 1), (1, 1, 2)]
+    assert index.prefix_lookup("omar s", column="firstname") == [(1, 1, 2)]
+    assert index.prefix_lookup("omar", column="Unknown") == []
+
+
+def test_replacing_a_file_drops_old_entries():
+    index = TableIndex()
+    index.add_document(make_document(1, ROWS))
+    index.add_document(make_document(1, [["Login"], ["zoe"]]))
+    assert index.lookup("omar1993") == []
+    assert index.prefix_lookup("omar") == []
+    assert index.lookup("zoe", column="login") == [(1, 1, 1)]
+    assert len(index) == 1
+
+
+def test_removing_a_file():
+    index = build_index([make_document(1, ROWS), make_document(2, [["Login"], ["omar1993"]])])
+    index.remove_file(1)
+    assert index.lookup("omar1993") == [(2, 1, 1)]
+    assert index.prefix_lookup("omar") == [(2, 1, 1)]
+    assert index.prefix_lookup("an", column="firstname") == []
+    index.remove_file(2)
+    assert index.prefix_lookup("") == []
+    assert len(index) == 0
+
+
+def test_value_repeated_in_one_row():
+    index = build_index([make_document(1, [["Login", "Email"], ["omar", "omar"]])])
+    assert index.lookup("omar") == [(1, 1, 1)]
+    assert index.lookup("omar", column="email") == [(1, 1, 1)]
+    index.remove_file(1)
+    assert index.lookup("omar") == []
+
+
+def test_large_batches_keep_keys_sorted():
+    rows = [["Value"]] + [["v%03d" % i] for i in range(100, 0, -1)]
+    index = build_index([make_document(1, rows), make_document(2, [["Value"], ["v050x"]])])
+    assert index.prefix_lookup("v050") == [(1, 1, 51), (2, 1, 1)]
+    assert len(index.prefix_lookup("v0", column="value")) == 100
+    index.remove_file(1)
+    assert index.prefix_lookup("v") == [(2, 1, 1)]
+
+
+def test_repeated_header_rows_are_not_indexed():
+    rows = [["Login", "Name"], ["omar1993", "Omar"], [" login", "NAME "], ["anna", "Anna"]]
+    index = build_index([make_document(1, rows)])
+    assert index.lookup("login") == []
+    assert index.lookup("login", column="login") == []
+    assert index.lookup("anna", column="login") == [(1, 1, 3)]